@@ -0,0 +1,123 @@
+"""
+Default currency tables shared by PricingService and PricingFetcher.
+Read-only (MappingProxyType); copy before mutating.
+"""
+from types import MappingProxyType
+
+DEFAULT_CURRENCY_RATES = MappingProxyType({
+    # Americas
+    "USD": 1.0,
+    "CAD": 1.35,
+    "MXN": 17.0,
+    "BRL": 5.0,
+    "ARS": 350.0,
+    "CLP": 900.0,
+    "COP": 4000.0,
+    "PEN": 3.7,
+
+    # Europe
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "CHF": 0.88,
+    "SEK": 10.5,
+    "NOK": 10.8,
+    "DKK": 6.9,
+    "PLN": 4.0,
+    "CZK": 23.0,
+    "HUF": 360.0,
+    "RON": 4.6,
+    "BGN": 1.8,
+    "HRK": 6.9,
+    "TRY": 32.0,
+    "RUB": 92.0,
+
+    # Asia-Pacific
+    "INR": 84.0,
+    "JPY": 150.0,
+    "CNY": 7.2,
+    "KRW": 1320.0,
+    "SGD": 1.34,
+    "HKD": 7.8,
+    "TWD": 31.5,
+    "THB": 35.0,
+    "MYR": 4.5,
+    "IDR": 15700.0,
+    "PHP": 56.0,
+    "VND": 24500.0,
+    "PKR": 278.0,
+    "BDT": 110.0,
+    "LKR": 305.0,
+    "AUD": 1.52,
+    "NZD": 1.68,
+
+    # Middle East & Africa
+    "AED": 3.67,
+    "SAR": 3.75,
+    "QAR": 3.64,
+    "KWD": 0.31,
+    "BHD": 0.38,
+    "ILS": 3.65,
+    "EGP": 49.0,
+    "ZAR": 18.5,
+    "NGN": 1550.0,
+    "KES": 129.0
+})
+
+DEFAULT_CURRENCY_SYMBOLS = MappingProxyType({
+    # Americas
+    "USD": "$",
+    "CAD": "C$",
+    "MXN": "Mex$",
+    "BRL": "R$",
+    "ARS": "ARS$",
+    "CLP": "CLP$",
+    "COP": "COL$",
+    "PEN": "S/",
+
+    # Europe
+    "EUR": "€",
+    "GBP": "£",
+    "CHF": "CHF",
+    "SEK": "kr",
+    "NOK": "kr",
+    "DKK": "kr",
+    "PLN": "zł",
+    "CZK": "Kč",
+    "HUF": "Ft",
+    "RON": "lei",
+    "BGN": "лв",
+    "HRK": "kn",
+    "TRY": "₺",
+    "RUB": "₽",
+
+    # Asia-Pacific
+    "INR": "₹",
+    "JPY": "¥",
+    "CNY": "¥",
+    "KRW": "₩",
+    "SGD": "S$",
+    "HKD": "HK$",
+    "TWD": "NT$",
+    "THB": "฿",
+    "MYR": "RM",
+    "IDR": "Rp",
+    "PHP": "₱",
+    "VND": "₫",
+    "PKR": "₨",
+    "BDT": "৳",
+    "LKR": "Rs",
+    "AUD": "A$",
+    "NZD": "NZ$",
+
+    # Middle East & Africa
+    "AED": "د.إ",
+    "SAR": "﷼",
+    "QAR": "ر.ق",
+    "KWD": "د.ك",
+    "BHD": "د.ب",
+    "ILS": "₪",
+    "EGP": "£",
+    "ZAR": "R",
+    "NGN": "₦",
+    "KES": "KSh"
+})
@@ -42,13 +42,12 @@ class Database:
                 logger.warning("Database not connected, skipping index creation")
                 return False
             
-            # Index for pricing lookups (most frequent query)
-            await db.pricing.create_index([("_id", 1)], unique=True, name="pricing_id_unique")
-            logger.info("✅ Created index: pricing._id")
+            # pricing / job_status lookups by _id use MongoDB's built-in _id index; re-declaring it
+            # with unique=True is rejected by the server and aborted the rest of this setup
             
-            # Index for job status lookups
-            await db.job_status.create_index([("_id", 1)], unique=True, name="job_status_id_unique")
-            logger.info("✅ Created index: job_status._id")
+            # Index for job status ordering by last run
+            await db.job_status.create_index([("last_run_timestamp", -1)], name="job_status_last_run")
+            logger.info("✅ Created index: job_status.last_run_timestamp")
             
             # Index for historical pricing (sorted by date for archival)
             await db.pricing_history.create_index([("archived_at", -1)], name="history_archived_at")
@@ -62,6 +61,10 @@ class Database:
             )
             logger.info("✅ Created TTL index: pricing_history (90 days)")
             
+            # Index for admin message listing (newest first)
+            await db.contact_messages.create_index([("created_at", -1)], name="contact_created_at")
+            logger.info("✅ Created index: contact_messages.created_at")
+            
             # Index for estimation logs if they exist
             await db.estimation_logs.create_index([("created_at", -1)], name="logs_created_at")
             logger.info("✅ Created index: estimation_logs.created_at")
@@ -14,6 +14,26 @@ class EmailService:
     # SENDER_EMAIL and SENDGRID_API_KEY will be loaded lazily in the method
     # to ensure environment variables are loaded by main.py first.
 
+    # Shared client: keeps the TLS connection to SendGrid warm across contact submissions
+    _client: httpx.AsyncClient = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=300),
+                timeout=10.0
+            )
+        return cls._client
+
+    @classmethod
+    async def close_client(cls):
+        """Close the shared AsyncClient (called on app shutdown)"""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+
     @classmethod
     async def send_contact_notification(cls, submission: dict):
         """
@@ -97,21 +117,19 @@ Message:
 
             logger.info(f"Sending email via SendGrid API to {sender_email}...")
             
-            # Use httpx for async HTTP request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    cls.SENDGRID_API_URL, 
-                    json=payload, 
-                    headers=headers, 
-                    timeout=10.0
-                )
-                
-                if response.status_code in (200, 201, 202):
-                    logger.info("✅ Email sent successfully via SendGrid API")
-                    return True
-                else:
-                    logger.error(f"❌ Failed to send email. Status: {response.status_code}, Body: {response.text}")
-                    return False
+            # Reuse the pooled client so repeat sends skip the TCP/TLS handshake
+            response = await cls.get_client().post(
+                cls.SENDGRID_API_URL, 
+                json=payload, 
+                headers=headers
+            )
+            
+            if response.status_code in (200, 201, 202):
+                logger.info("✅ Email sent successfully via SendGrid API")
+                return True
+            else:
+                logger.error(f"❌ Failed to send email. Status: {response.status_code}, Body: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"❌ Error sending email via SendGrid: {e}", exc_info=True)
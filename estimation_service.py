@@ -269,15 +269,9 @@ class EstimationService:
     @staticmethod
     def calculate_multi_cloud_costs(base_cost_usd: float, currency: str) -> dict:
         """Calculate costs across all cloud providers using database multipliers"""
-        multi_cloud = {}
-        
-        # Calculate cost for each provider
-        for provider, multiplier in PricingService.CLOUD_MULTIPLIERS.items():
-            provider_cost_usd = base_cost_usd * multiplier
-            provider_cost_converted = PricingService.convert(provider_cost_usd, currency)
-            multi_cloud[provider] = provider_cost_converted
-        
-        return multi_cloud
+        # Convert once, then scale per provider (multipliers are relative, so the order doesn't matter)
+        base_converted = PricingService.convert(base_cost_usd, currency)
+        return {provider: base_converted * multiplier for provider, multiplier in PricingService.CLOUD_MULTIPLIER_ITEMS}
     
     @staticmethod
     def estimate(architecture: ArchitectureType, traffic: TrafficInput, currency: str = "USD") -> EstimationResult:
@@ -425,7 +419,7 @@ class EstimationService:
                 "description": "Commit to 1-year usage for consistent workloads to save ~40% on compute."
             })
 
-        if architecture in [ArchitectureType.MICROSERVICES, ArchitectureType.HYBRID]:
+        if architecture in (ArchitectureType.MICROSERVICES, ArchitectureType.HYBRID):
              spot_saving_usd = compute_usd * 0.70 * 0.3
              spot_saving = PricingService.convert(spot_saving_usd, currency)
              optimization_suggestions.append({
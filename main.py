@@ -1,17 +1,25 @@
 from fastapi import FastAPI, Body, HTTPException, Depends, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from contextlib import asynccontextmanager
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
+import asyncio
 import logging
 import json
+import gzip
+import time
 from datetime import datetime, timedelta
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
-import hashlib
+import orjson
+import xxhash
+from pydantic import BaseModel
 
-from schemas import TrafficInput, ArchitectureType, EstimationResult, ContactSubmission
+from schemas import TrafficInput, TRAFFIC_ADAPTER, ARCHITECTURE_BY_VALUE, ArchitectureType, EstimationResult, ContactSubmission
 from estimation_service import EstimationService
 from pricing_service import PricingService
 from database import Database
@@ -52,15 +60,88 @@ logging.root.setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
-# Scheduler setup
-scheduler = AsyncIOScheduler()
+async def scheduled_price_refresh():
+    """Daily job: fetch latest prices and reload them so PRICING_VERSION (and ETags) advance"""
+    if await PricingFetcher.fetch_latest_prices():
+        await PricingService.load_dynamic_prices()
+        invalidate_pricing_status()
+
+async def daily_price_refresh_loop():
+    """Run scheduled_price_refresh every day at 00:00 UTC (replaces a full APScheduler instance)"""
+    while True:
+        now = datetime.utcnow()
+        next_run = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        await asyncio.sleep((next_run - now).total_seconds())
+        try:
+            await scheduled_price_refresh()
+        except Exception:
+            logger.exception("Scheduled price fetch failed")
+
+@lru_cache(maxsize=1)
+def iso_now(epoch_seconds: int) -> str:
+    """ISO timestamp for a whole UTC second; call as iso_now(int(time.time())) so bursts share one string"""
+    return datetime.utcfromtimestamp(epoch_seconds).isoformat()
+
+def estimate_cache_key(raw_body: bytes) -> str:
+    """Cache key for /estimate: xxh3 of the raw request bytes combined with the pricing version"""
+    # A client re-sending the same request sends the same bytes, so no decode/re-serialize is needed
+    return f"{xxhash.xxh3_64_hexdigest(raw_body)}-{PricingService.PRICING_VERSION}"
+
+# In-process LRU of serialized estimate bodies, keyed by a tuple of primitives and frozen sub-configs (see estimate_result_key)
+ESTIMATE_CACHE_SIZE = 1024
+estimate_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+def orjson_default(obj):
+    """orjson fallback for pydantic models nested in dataclass results (EstimationResult.traffic_input)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def estimate_result_key(architecture: str, currency: str, traffic: TrafficInput) -> tuple:
+    """Dict key for the estimate cache; tuples and the frozen sub-config models hash natively, no serialization needed"""
+    return (
+        architecture,
+        currency,
+        PricingService.PRICING_VERSION,
+        traffic.daily_active_users,
+        traffic.api_requests_per_user,
+        traffic.storage_per_user_mb,
+        traffic.peak_traffic_multiplier,
+        traffic.growth_rate_yoy,
+        traffic.revenue_per_user_monthly,
+        traffic.funding_available,
+        traffic.database,
+        traffic.cdn,
+        traffic.messaging,
+        traffic.security,
+        traffic.monitoring,
+        traffic.cicd,
+        traffic.multi_region,
+    )
+
+def etag_matches(if_none_match: str, cache_key: str) -> bool:
+    """Weak comparison of an If-None-Match header against a cache key"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == cache_key:
+            return True
+    return False
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up ArchCost API...")
+    # Thread pool for CPU-bound work offloaded from the event loop (e.g. cost estimation)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
     # Optionally skip DB and scheduler startup for local/testing if SKIP_STARTUP_DB=true
     skip_startup = os.getenv("SKIP_STARTUP_DB", "false").lower() == "true"
+    scheduler_task = None
     
     if not skip_startup:
         # Connect to Database with timeout protection
@@ -81,8 +162,7 @@ async def lifespan(app: FastAPI):
             await PricingService.load_dynamic_prices()
 
             # Start scheduler
-            scheduler.add_job(PricingFetcher.fetch_latest_prices, 'cron', hour=0, minute=0) # Run at midnight
-            scheduler.start()
+            scheduler_task = asyncio.create_task(daily_price_refresh_loop()) # Run at midnight
             logger.info("Scheduler started. Price fetch job scheduled for 00:00 daily.")
         except Exception as e:
             logger.error(f"Failed to connect to Database or start scheduler: {e}")
@@ -94,29 +174,44 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
-    try:
-        scheduler.shutdown()
-    except Exception:
+    if scheduler_task is not None:
+        scheduler_task.cancel()
+    else:
         # Scheduler may not have been started (e.g., SKIP_STARTUP_DB=true)
-        logger.info("Scheduler was not running at shutdown; skipping scheduler.shutdown()")
+        logger.info("Scheduler was not running at shutdown; skipping scheduler cancel")
+    await PricingFetcher.close_client()
+    await EmailService.close_client()
     Database.close()
-    logger.info("Scheduler and Database connection shut down.")
+    logger.info("Scheduler, HTTP clients and Database connection shut down.")
 
-app = FastAPI(title="ArchCost API", version="0.1.0", lifespan=lifespan)
+# orjson-backed responses for every endpoint that returns plain dicts (status, messages, ...)
+app = FastAPI(title="ArchCost API", version="0.1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
-# Add GZIP compression middleware for large responses
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add GZIP compression middleware for JSON/HTML responses (repetitive JSON compresses 4-5x)
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
 # Add rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Explicit CORS allow-list (comma-separated ALLOWED_ORIGINS overrides the production defaults).
+# A wildcard combined with credentials makes Starlette echo back any Origin on every response.
+# The local frontend dev server is only allowed when CORS_ALLOW_LOCALHOST=true is set explicitly.
+ALLOWED_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "https://archcost.app,https://www.archcost.app").split(",")
+    if origin.strip()
+)
+if os.getenv("CORS_ALLOW_LOCALHOST", "false").lower() == "true":
+    ALLOWED_ORIGINS += ("http://localhost:3000",)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
+    max_age=3600,
 )
 
 @app.get("/")
@@ -134,7 +229,7 @@ async def health_check():
         
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": iso_now(int(time.time())),
             "version": "0.1.0"
         }
     except Exception as e:
@@ -143,12 +238,32 @@ async def health_check():
 
 @app.post("/estimate", response_model=EstimationResult)
 @limiter.limit(RATE_LIMITS["estimate"])
-async def estimate_cost(
-    request: Request,
-    payload: dict = Body(...)
-):
+async def estimate_cost(request: Request):
     """Calculate infrastructure cost based on architecture and traffic"""
     try:
+        raw_body = await request.body()
+
+        # Weak ETag keyed on the raw body bytes and the pricing data version, computed BEFORE parsing or
+        # heavy compute so different inputs (or a pricing refresh) produce different keys and allow conditional responses
+        cache_key = estimate_cache_key(raw_body)
+        etag = f'W/"{cache_key}"'
+
+        # If client provided If-None-Match header and it matches, return 304 Not Modified
+        client_etag = request.headers.get('if-none-match')
+        if client_etag and etag_matches(client_etag, cache_key):
+            logger.info("ETag matches client If-None-Match; returning 304")
+            # Return minimal 304 response with ETag so client can reuse cached body
+            return Response(status_code=304, headers={
+                'ETag': etag,
+                'Cache-Control': 'no-store',
+                'Vary': 'Accept-Encoding, Content-Type, Accept'
+            })
+
+        # Parse the raw body with orjson in one pass instead of FastAPI's json.loads-backed Body(...)
+        payload = orjson.loads(raw_body)
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+
         # Extract parameters from request body
         architecture = payload.get('architecture')
         traffic_dict = payload.get('traffic')
@@ -157,63 +272,40 @@ async def estimate_cost(
         # Validate required fields
         if not architecture or not traffic_dict:
             raise ValueError("Missing required fields: architecture and traffic")
-        
-        # Convert traffic dict to TrafficInput object
-        traffic = TrafficInput(**traffic_dict)
-
-        # Generate comprehensive cache key including ALL traffic parameters BEFORE heavy compute
-        # This ensures different inputs produce different cache keys and allows conditional responses
-        import json
-        cache_key_dict = {
-            'architecture': architecture,
-            'currency': currency,
-            'daily_active_users': traffic.daily_active_users,
-            'api_requests_per_user': traffic.api_requests_per_user,
-            'storage_per_user_mb': traffic.storage_per_user_mb,
-            'peak_traffic_multiplier': traffic.peak_traffic_multiplier,
-            'growth_rate_yoy': traffic.growth_rate_yoy,
-            'revenue_per_user_monthly': traffic.revenue_per_user_monthly,
-            'funding_available': traffic.funding_available,
-            'database': traffic.database.model_dump(),
-            'cdn': traffic.cdn.model_dump(),
-            'messaging': traffic.messaging.model_dump(),
-            'security': traffic.security.model_dump(),
-            'monitoring': traffic.monitoring.model_dump(),
-            'cicd': traffic.cicd.model_dump(),
-            'multi_region': traffic.multi_region.model_dump(),
-        }
-        cache_key = json.dumps(cache_key_dict, sort_keys=True)
-        etag = hashlib.md5(cache_key.encode()).hexdigest()
-
-        # If client provided If-None-Match header and it matches, return 304 Not Modified
-        client_etag = request.headers.get('if-none-match')
-        if client_etag:
-            # strip optional quotes
-            client_etag_clean = client_etag.strip('"')
-            if client_etag_clean == etag:
-                logger.info("ETag matches client If-None-Match; returning 304")
-                # Return minimal 304 response with ETag so client can reuse cached body
-                return Response(status_code=304, headers={
-                    'ETag': f'"{etag}"',
-                    'Cache-Control': 'no-store',
-                    'Vary': 'Accept-Encoding, Content-Type, Accept'
-                })
-
-        # Perform estimation (expensive) only when needed
-        logger.info(f"Estimating cost for {architecture} with {traffic.daily_active_users} DAU")
-        result = EstimationService.estimate(architecture, traffic, currency)
-        logger.info(f"Estimation completed successfully. Total cost: {result.monthly_cost.total}")
+        # Reject unknown architectures up front rather than after a full estimate
+        architecture_type = ARCHITECTURE_BY_VALUE.get(architecture) if isinstance(architecture, str) else None
+        if architecture_type is None:
+            raise ValueError(f"Unknown architecture; expected one of: {', '.join(ARCHITECTURE_BY_VALUE)}")
+
+        # Validate the traffic input only on a cache miss: identical raw input validates identically,
+        # so a 304 never pays for JSON parsing or the pydantic model build
+        traffic = TRAFFIC_ADAPTER.validate_python(traffic_dict)
+
+        result_key = estimate_result_key(architecture, currency, traffic)
+        body = estimate_cache.get(result_key)
+        if body is not None:
+            estimate_cache.move_to_end(result_key)
+            logger.info(f"Serving cached estimate for {architecture} with {traffic.daily_active_users} DAU")
+        else:
+            # Perform estimation (expensive) only when needed
+            logger.info(f"Estimating cost for {architecture} with {traffic.daily_active_users} DAU")
+            # Run the synchronous estimation off the event loop so /health and /contact don't stall behind it
+            result = await asyncio.to_thread(EstimationService.estimate, architecture_type, traffic, currency)
+            logger.info(f"Estimation completed successfully. Total cost: {result.monthly_cost.total}")
+            body = orjson.dumps(result, default=orjson_default)
+            estimate_cache[result_key] = body
+            if len(estimate_cache) > ESTIMATE_CACHE_SIZE:
+                estimate_cache.popitem(last=False)
 
         # Set response headers for caching and cache-busting
-        from fastapi.responses import JSONResponse
-        response = JSONResponse(content=result.model_dump())
+        response = Response(content=body, media_type="application/json")
         # Use no-store to avoid intermediate caches storing potentially stale dynamic results
         response.headers["Cache-Control"] = "no-store, must-revalidate"
         response.headers["Pragma"] = "no-cache"
         response.headers["Expires"] = "0"
-        response.headers["ETag"] = f'"{etag}"'
+        response.headers["ETag"] = etag
         response.headers["Vary"] = "Accept-Encoding, Content-Type, Accept"
-        response.headers["X-Cache-Key"] = etag
+        response.headers["X-Cache-Key"] = cache_key
 
         return response
     except ValueError as ve:
@@ -256,10 +348,21 @@ async def submit_contact_form(
         logger.error(f"Error submitting contact form: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to submit message")
 
-@app.get("/admin")
-async def admin_portal():
-    """Admin portal HTML page - login form"""
-    html_content = """
+def precompress_html(html: str) -> tuple[bytes, bytes]:
+    """Encode a static HTML page once at import, returning (raw, gzipped) bytes"""
+    raw = html.encode("utf-8")
+    return raw, gzip.compress(raw, compresslevel=9)
+
+def html_response(request: Request, raw: bytes, gz: bytes) -> Response:
+    """Serve a precompressed static page, picking gzip when the client accepts it.
+    GZipMiddleware passes responses that already carry Content-Encoding through untouched."""
+    headers = {"Vary": "Accept-Encoding", "Cache-Control": "public, max-age=3600"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gz, media_type="text/html", headers=headers)
+    return Response(content=raw, media_type="text/html", headers=headers)
+
+ADMIN_PORTAL_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -337,14 +440,15 @@ async def admin_portal():
         </script>
     </body>
     </html>
-    """
-    from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=html_content)
+"""
+ADMIN_PORTAL_BYTES, ADMIN_PORTAL_GZ = precompress_html(ADMIN_PORTAL_HTML)
 
-@app.get("/admin/dashboard-ui")
-async def admin_dashboard_ui():
-    """Admin dashboard UI page"""
-    html_content = """
+@app.get("/admin")
+async def admin_portal(request: Request):
+    """Admin portal HTML page - login form"""
+    return html_response(request, ADMIN_PORTAL_BYTES, ADMIN_PORTAL_GZ)
+
+ADMIN_DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -563,7 +667,7 @@ async def admin_dashboard_ui():
                     });
                     
                     if (response.ok) {
-                        showSuccess('Prices refreshed successfully!');
+                        showSuccess('Price refresh started!');
                         setTimeout(() => loadDashboard(), 1000);
                     } else {
                         showError('Failed to refresh prices');
@@ -601,11 +705,15 @@ async def admin_dashboard_ui():
         </script>
     </body>
     </html>
-    """
-    from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=html_content)
+"""
+ADMIN_DASHBOARD_BYTES, ADMIN_DASHBOARD_GZ = precompress_html(ADMIN_DASHBOARD_HTML)
+
+@app.get("/admin/dashboard-ui")
+async def admin_dashboard_ui(request: Request):
+    """Admin dashboard UI page"""
+    return html_response(request, ADMIN_DASHBOARD_BYTES, ADMIN_DASHBOARD_GZ)
 
-@app.get("/admin/dashboard")
+@app.get("/admin/dashboard", response_class=ORJSONResponse)
 @limiter.limit(RATE_LIMITS["admin"])
 async def admin_dashboard(request: Request, admin: dict = Depends(verify_admin_token)):
     """Admin dashboard - shows pricing job status and last run info"""
@@ -614,34 +722,50 @@ async def admin_dashboard(request: Request, admin: dict = Depends(verify_admin_t
         if db is None:
             raise HTTPException(status_code=503, detail="Database not connected")
         
-        # Get job status
-        job_status = await db.job_status.find_one({"_id": "pricing_job_status"})
-        
-        # Get current pricing metadata
-        current_pricing = await db.pricing.find_one({"_id": "latest_pricing"})
+        # Issue the independent reads concurrently over the Motor connection pool:
+        # job status, current pricing meta (projected server-side to meta + currency count), and
+        # one $facet aggregation returning both the history count and the two newest backups
+        job_status, current_pricing, history = await asyncio.gather(
+            db.job_status.find_one({"_id": "pricing_job_status"}),
+            db.pricing.find_one(
+                {"_id": "latest_pricing"},
+                projection={
+                    "meta": 1,
+                    "currency_count": {"$size": {"$objectToArray": {"$ifNull": ["$currency_rates", {}]}}}
+                }
+            ),
+            db.pricing_history.aggregate([
+                {"$facet": {
+                    "count": [{"$count": "n"}],
+                    "backups": [
+                        {"$sort": {"archived_at": -1}},
+                        {"$limit": 2},
+                        {"$project": {
+                            "archived_at": 1,
+                            "meta.sources": 1,
+                            "currency_count": {"$size": {"$objectToArray": {"$ifNull": ["$currency_rates", {}]}}}
+                        }}
+                    ]
+                }}
+            ]).to_list(length=1)
+        )
+        facets = history[0] if history else {}
+        history_count = facets["count"][0]["n"] if facets.get("count") else 0
+        history_backups = facets.get("backups", [])
         pricing_meta = current_pricing.get("meta", {}) if current_pricing else {}
         
-        # Get history count and details
-        history_count = await db.pricing_history.count_documents({})
-        history_backups = await db.pricing_history.find(
-            {}, 
-            sort=[("archived_at", -1)]
-        ).to_list(length=2)
-        
         # Format history details
         backup_details = []
         for backup in history_backups:
             backup_details.append({
                 "archived_at": backup.get("archived_at"),
                 "sources": backup.get("meta", {}).get("sources", []),
-                "currencies": len(backup.get("currency_rates", {}))
+                "currencies": backup.get("currency_count", 0)
             })
         
-        # Calculate next run (daily at 00:00 UTC)
-        from datetime import datetime, timedelta
-        now = datetime.utcnow()
-        next_run = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        time_until_next = next_run - now
+        # Calculate next run (daily at 00:00 UTC) with epoch arithmetic
+        now_s = int(time.time())
+        secs_until_next = 86400 - (now_s % 86400)
         
         # Parse job status
         job_info = {
@@ -672,7 +796,7 @@ async def admin_dashboard(request: Request, admin: dict = Depends(verify_admin_t
             "current_pricing": {
                 "last_updated": pricing_meta.get("last_updated"),
                 "sources": pricing_meta.get("sources", []),
-                "total_currencies_configured": len(current_pricing.get("currency_rates", {})) if current_pricing else 0,
+                "total_currencies_configured": current_pricing.get("currency_count", 0) if current_pricing else 0,
             },
             "historical_backups": {
                 "total_count": history_count,
@@ -680,17 +804,17 @@ async def admin_dashboard(request: Request, admin: dict = Depends(verify_admin_t
                 "backups": backup_details
             },
             "scheduling": {
-                "next_scheduled_run": next_run.isoformat(),
-                "time_until_next_run_seconds": int(time_until_next.total_seconds()),
+                "next_scheduled_run": datetime.utcfromtimestamp(now_s + secs_until_next).isoformat(),
+                "time_until_next_run_seconds": secs_until_next,
                 "schedule": "Daily at 00:00 UTC",
             },
             "manual_trigger_endpoint": "/admin/refresh-prices",
-            "timestamp": datetime.utcnow().isoformat()
+            # Formatted directly: alternating two keys through the single-entry iso_now cache would miss both times
+            "timestamp": datetime.utcfromtimestamp(now_s).isoformat()
         }
         
-        # Cache admin dashboard for 1 minute (short TTL for freshness)
-        from fastapi.responses import JSONResponse
-        response = JSONResponse(content=dashboard_data)
+        # Cache admin dashboard for 1 minute (short TTL for freshness); orjson serializes in one C pass
+        response = ORJSONResponse(content=dashboard_data)
         response.headers["Cache-Control"] = "private, max-age=60, must-revalidate"
         response.headers["Vary"] = "Accept-Encoding"
         return response
@@ -707,36 +831,44 @@ async def get_admin_messages(request: Request, admin: dict = Depends(verify_admi
         if db is None:
             raise HTTPException(status_code=503, detail="Database not connected")
         
-        # Get latest 50 messages
-        cursor = db.contact_messages.find().sort("created_at", -1).limit(50)
+        # Get latest 50 messages (only the fields the dashboard table renders)
+        cursor = db.contact_messages.find(
+            {},
+            projection={"name": 1, "email": 1, "subject": 1, "message": 1, "created_at": 1}
+        ).sort("created_at", -1).limit(50)
         messages = await cursor.to_list(length=50)
         
         # Convert ObjectId to string
-        for msg in messages:
-            msg["_id"] = str(msg["_id"])
+        messages = [{**msg, "_id": str(msg["_id"])} for msg in messages]
             
         return {"messages": messages}
     except Exception as e:
         logger.error(f"Error fetching messages: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/admin/refresh-prices")
+async def _run_refresh():
+    """Background job for /admin/refresh-prices: fetch, reload, and record unexpected failures"""
+    try:
+        await scheduled_price_refresh()
+    except Exception as e:
+        logger.error(f"Error refreshing prices: {e}", exc_info=True)
+        db = Database.get_db()
+        if db is not None:
+            await PricingFetcher.track_job_status(db, "failed", error=str(e))
+
+@app.post("/admin/refresh-prices", status_code=202)
 @limiter.limit(RATE_LIMITS["admin"])
-async def refresh_prices(request: Request, admin: dict = Depends(verify_admin_token)):
+async def refresh_prices(request: Request, background_tasks: BackgroundTasks, admin: dict = Depends(verify_admin_token)):
     """Manually trigger price fetch - protected endpoint"""
     try:
         logger.info(f"Manual price refresh triggered by admin: {admin.get('sub')}")
-        success = await PricingFetcher.fetch_latest_prices()
-        if success:
-            # Reload the new data into memory
-            await PricingService.load_dynamic_prices()
-            return {
-                "status": "success",
-                "message": "Pricing data refreshed successfully",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to refresh pricing data")
+        # Fetch + archive + reload runs after the response; the dashboard polls job_status for the outcome
+        background_tasks.add_task(_run_refresh)
+        return {
+            "status": "accepted",
+            "message": "Pricing refresh started",
+            "timestamp": iso_now(int(time.time()))
+        }
     except Exception as e:
         logger.error(f"Error refreshing prices: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -751,7 +883,8 @@ async def admin_login(request: Request, credentials: dict = Body(...)):
     if not username or not password:
         raise HTTPException(status_code=400, detail="Username and password required")
     
-    token = authenticate_admin(username, password)
+    # pbkdf2 (hash derivation on first login, then verify) is CPU-bound: keep it off the event loop
+    token = await asyncio.to_thread(authenticate_admin, username, password)
     if token:
         return {
             "access_token": token,
@@ -763,31 +896,65 @@ async def admin_login(request: Request, credentials: dict = Body(...)):
         detail="Invalid credentials"
     )
 
+# In-process TTL cache for /pricing/status: (payload, expires_at on the monotonic clock)
+PRICING_STATUS_TTL = 60
+pricing_status_cache = None
+pricing_status_lock = asyncio.Lock()
+
+def invalidate_pricing_status():
+    """Drop the cached /pricing/status payload (call after pricing is reloaded)"""
+    global pricing_status_cache
+    pricing_status_cache = None
+
+async def load_pricing_status() -> dict:
+    """Build the /pricing/status payload from MongoDB, falling back to the in-memory defaults"""
+    db = Database.get_db()
+    if db is not None:
+        pricing_doc = await db.pricing.find_one(
+            {"_id": "latest_pricing"},
+            projection={
+                "meta": 1,
+                "multi_cloud": 1,
+                "currency_count": {"$size": {"$objectToArray": {"$ifNull": ["$currency_rates", {}]}}}
+            }
+        )
+        if pricing_doc:
+            meta = pricing_doc.get("meta", {})
+            return {
+                "using_database": True,
+                "last_updated": meta.get("last_updated"),
+                "sources": meta.get("sources", []),
+                "cloud_multipliers": pricing_doc.get("multi_cloud", PricingService.CLOUD_MULTIPLIERS),
+                "currencies_available": pricing_doc.get("currency_count", 0)
+            }
+    
+    return {
+        "using_database": False,
+        "last_updated": None,
+        "sources": ["Hardcoded defaults"],
+        "cloud_multipliers": PricingService.CLOUD_MULTIPLIERS,
+        "currencies_available": len(PricingService.CURRENCY_RATES)
+    }
+
 @app.get("/pricing/status")
 @limiter.limit(RATE_LIMITS["pricing_status"])
 async def get_pricing_status(request: Request):
     """Get current pricing configuration status"""
+    global pricing_status_cache
     try:
-        db = Database.get_db()
-        if db is not None:
-            pricing_doc = await db.pricing.find_one({"_id": "latest_pricing"})
-            if pricing_doc:
-                meta = pricing_doc.get("meta", {})
-                return {
-                    "using_database": True,
-                    "last_updated": meta.get("last_updated"),
-                    "sources": meta.get("sources", []),
-                    "cloud_multipliers": pricing_doc.get("multi_cloud", PricingService.CLOUD_MULTIPLIERS),
-                    "currencies_available": len(pricing_doc.get("currency_rates", {}))
-                }
+        cached = pricing_status_cache
+        if cached is None or cached[1] <= time.monotonic():
+            # Only one coroutine repopulates after expiry; the rest reuse its result
+            async with pricing_status_lock:
+                cached = pricing_status_cache
+                if cached is None or cached[1] <= time.monotonic():
+                    payload = await load_pricing_status()
+                    # Never cache across the daily 00:00 UTC refresh
+                    ttl = min(PRICING_STATUS_TTL, 86400 - int(time.time()) % 86400)
+                    cached = (payload, time.monotonic() + ttl)
+                    pricing_status_cache = cached
         
-        return {
-            "using_database": False,
-            "last_updated": None,
-            "sources": ["Hardcoded defaults"],
-            "cloud_multipliers": PricingService.CLOUD_MULTIPLIERS,
-            "currencies_available": len(PricingService.CURRENCY_RATES)
-        }
+        return ORJSONResponse(content=cached[0], headers={"Cache-Control": f"public, max-age={PRICING_STATUS_TTL}"})
     except Exception as e:
         logger.error(f"Error getting pricing status: {e}")
         return {
@@ -797,29 +964,39 @@ async def get_pricing_status(request: Request):
             "currencies_available": len(PricingService.CURRENCY_RATES)
         }
 
-@app.get("/providers")
-@limiter.limit(RATE_LIMITS["providers"])
-async def get_cloud_providers(request: Request):
-    """Get list of all supported cloud providers with their multipliers and categories"""
-    def categorize(provider: str) -> str:
-        major = ["AWS", "Azure", "GCP", "Oracle Cloud", "IBM Cloud"]
-        dev = ["DigitalOcean", "Linode", "Vultr", "Hetzner"]
-        indian = ["Tata IZO", "CtrlS", "Netmagic", "Yotta"]
-        if provider in major:
-            return "Major Global"
-        elif provider in dev:
-            return "Developer-Focused"
-        elif provider in indian:
-            return "Indian Providers"
-        return "Regional/Specialized"
-    
-    return {
+# Provider categories for /providers (frozensets for O(1) membership)
+PROVIDER_CATEGORIES = {
+    "Major Global": frozenset({"AWS", "Azure", "GCP", "Oracle Cloud", "IBM Cloud"}),
+    "Developer-Focused": frozenset({"DigitalOcean", "Linode", "Vultr", "Hetzner"}),
+    "Indian Providers": frozenset({"Tata IZO", "CtrlS", "Netmagic", "Yotta"}),
+}
+
+def categorize_provider(provider: str) -> str:
+    for category, members in PROVIDER_CATEGORIES.items():
+        if provider in members:
+            return category
+    return "Regional/Specialized"
+
+@lru_cache(maxsize=1)
+def providers_payload(pricing_version: int) -> bytes:
+    """Serialized /providers body; multipliers only change when pricing is reloaded (new version)"""
+    return orjson.dumps({
         "providers": [
             {
                 "name": provider,
                 "multiplier": multiplier,
-                "category": categorize(provider)
+                "category": categorize_provider(provider)
             }
             for provider, multiplier in PricingService.CLOUD_MULTIPLIERS.items()
         ]
-    }
+    })
+
+@app.get("/providers")
+@limiter.limit(RATE_LIMITS["providers"])
+async def get_cloud_providers(request: Request):
+    """Get list of all supported cloud providers with their multipliers and categories"""
+    return Response(
+        content=providers_payload(PricingService.PRICING_VERSION),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
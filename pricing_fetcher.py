@@ -4,62 +4,447 @@ Enhanced pricing fetcher with comprehensive multi-cloud pricing:
 - Stores comprehensive pricing breakdowns in MongoDB
 - Maintains historical backups and job status tracking
 """
+import asyncio
+import hashlib
 import httpx
-import json
 import logging
+import orjson
 import os
+import random
+import time
+from contextlib import aclosing
 from datetime import datetime
 from database import get_database
+from currencies import DEFAULT_CURRENCY_RATES
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Fall back to a whole-body orjson parse of the AWS catalogue
+
+# Currencies kept from the exchange-rate feed (USD is the base and is always 1.0, so it isn't listed)
+SUPPORTED_CURRENCIES = frozenset({
+    "CAD", "MXN", "BRL", "ARS", "EUR", "GBP", "CHF",
+    "INR", "JPY", "CNY", "KRW", "SGD", "HKD", "AUD", "NZD",
+    "AED", "SAR", "ZAR"
+})
+
+HOURS_PER_MONTH = 730  # 730 hours/month average
+
+# EC2 instance types collected from the AWS feed (t3 and m5 families)
+AWS_COMPUTE_TYPES = frozenset({
+    "t3.micro", "t3.small", "t3.medium", "t3.large", "t3.xlarge",
+    "m5.large", "m5.xlarge", "m5.2xlarge"
+})
+
+# RDS estimates as multiples of the t3.medium hourly rate, pre-multiplied by HOURS_PER_MONTH
+# (RDS is typically 1.5-2x compute cost)
+RDS_HOURLY_FACTORS = {
+    "rds_db.t3.micro": 0.4 * HOURS_PER_MONTH,
+    "rds_db.t3.medium": 1.6 * HOURS_PER_MONTH,
+    "rds_db.t3.large": 3.2 * HOURS_PER_MONTH,
+}
+
+# ARM SKU names of the VMs priced from Azure (see AZURE_SKU_MAP)
+AZURE_VM_SKUS = ("Standard_D2s_v3", "Standard_D2_v3", "Standard_D4s_v3", "Standard_D4_v3", "Standard_B1s")
+
+# Azure Retail Prices query for pay-as-you-go VMs in eastus, narrowed server-side to AZURE_VM_SKUS
+# (a few rows per SKU: Linux/Windows x regular/Spot/Low Priority)
+AZURE_VM_PARAMS = {
+    "$filter": (
+        "armRegionName eq 'eastus' and serviceName eq 'Virtual Machines' and priceType eq 'Consumption' and ("
+        + " or ".join(f"armSkuName eq '{sku}'" for sku in AZURE_VM_SKUS)
+        + ")"
+    ),
+    "$top": "50",
+    "$select": "skuName,productName,retailPrice",
+}
+
+# (skuName fragment, pricing key), checked in order
+AZURE_SKU_MAP = (
+    ("D2s v3", "d2s_v3"), ("D2 v3", "d2s_v3"),
+    ("D4s v3", "d4s_v3"), ("D4 v3", "d4s_v3"),
+    ("B1s", "b1s"),
+)
+
+# GCP official pricing (updated Q4 2024)
+GCP_STATIC_PRICING = {
+    "compute": {
+        "e2-micro": 6.11,  # Monthly
+        "e2-small": 12.23,
+        "e2-medium": 24.45,
+        "e2-standard-2": 48.90,
+        "n1-standard-1": 24.27,
+        "n1-standard-2": 48.54,
+    },
+    "database": {
+        "cloud_sql_micro": 7.67,  # db-f1-micro
+        "cloud_sql_small": 25.00,  # db-g1-small  
+        "cloud_sql_standard": 107.30,  # db-n1-standard-1
+        "firestore_gb": 0.18,  # Per GB
+    },
+    "storage": {
+        "standard_gb": 0.020,  # Cloud Storage Standard
+        "nearline_gb": 0.010,  # Nearline
+        "coldline_gb": 0.004,  # Coldline
+    },
+    "networking": {
+        "load_balancer": 18.26,  # Cloud Load Balancer
+        "egress_gb": 0.12,  # First tier egress
+    },
+    "cdn": {
+        "cloud_cdn_gb": 0.08,  # Cloud CDN
+    }
+}
+
+# DigitalOcean official pricing (updated Q4 2024)
+DIGITALOCEAN_STATIC_PRICING = {
+    "compute": {
+        "basic_1gb": 6.00,  # Basic droplet 1GB
+        "basic_2gb": 12.00,  # Basic droplet 2GB
+        "basic_4gb": 24.00,  # Basic droplet 4GB
+        "general_2gb": 18.00,  # General Purpose 2GB
+        "general_4gb": 36.00,  # General Purpose 4GB
+    },
+    "database": {
+        "managed_db_1gb": 15.00,  # Managed Database 1GB  
+        "managed_db_2gb": 30.00,  # Managed Database 2GB
+        "managed_db_4gb": 60.00,  # Managed Database 4GB
+    },
+    "storage": {
+        "spaces_gb": 0.02,  # Spaces (S3-compatible)
+        "block_storage_gb": 0.10,  # Block Storage
+    },
+    "networking": {
+        "load_balancer": 12.00,  # Load Balancer monthly
+        "bandwidth_gb": 0.01,  # Overage bandwidth
+    },
+    "cdn": {
+        "cdn_gb": 0.01,  # CDN bandwidth
+    }
+}
+
+# Hetzner pricing (static from documentation)
+HETZNER_STATIC_PRICING = {
+    "compute": {
+        "cx11": 3.29,  # 1 vCPU, 2GB RAM
+        "cx21": 5.83,  # 2 vCPU, 4GB RAM
+        "cx31": 11.17,  # 2 vCPU, 8GB RAM
+        "cx41": 21.34,  #  4 vCPU, 16GB RAM
+    },
+    "database": {
+        "managed_postgresql_1gb": 10.00,
+        "managed_mysql_1gb": 10.00,
+    },
+    "storage": {
+        "volume_gb": 0.04,  # Block storage per GB
+        "snapshot_gb": 0.01,  # Snapshot per GB
+    },
+    "networking": {
+        "load_balancer": 4.90,  # Load Balancer monthly
+        "traffic_gb": 0.011,  # Outbound traffic
+    },
+    "cdn": {}
+}
+
+# Remaining providers (static)
+OTHER_PROVIDER_STATIC_PRICING = {
+    "Linode": {
+        "compute": {"nanode_1gb": 5.00, "linode_2gb": 10.00, "linode_4gb": 20.00},
+        "database": {"managed_db_1gb": 15.00},
+        "storage": {"block_storage_gb": 0.10},
+        "networking": {"lb_monthly": 10.00},
+        "cdn": {}
+    },
+    "Vultr": {
+        "compute": {"vc2_1c_1gb": 6.00, "vc2_2c_4gb": 18.00},
+        "database": {"managed_db_1gb": 15.00},
+        "storage": {"block_storage_gb": 0.10},
+        "networking": {},
+        "cdn": {}
+    },
+    # Indian Providers
+    "Tata IZO": {
+        "compute": {"small": 15.00, "medium": 30.00},
+        "database": {},
+        "storage": {"storage_gb": 0.03},
+        "networking": {},
+        "cdn": {}
+    },
+    "CtrlS": {
+        "compute": {"small": 18.00, "medium": 35.00},
+        "database": {},
+        "storage": {"storage_gb": 0.03},
+        "networking": {},
+        "cdn": {}
+    },
+    "Netmagic": {
+        "compute": {"small": 20.00, "medium": 40.00},
+        "database": {},
+        "storage": {"storage_gb": 0.04},
+        "networking": {},
+        "cdn": {}
+    },
+    "Yotta": {
+        "compute": {"small": 16.00, "medium": 32.00},
+        "database": {},
+        "storage": {"storage_gb": 0.03},
+        "networking": {},
+        "cdn": {}
+    },
+    # Regional providers  
+    "Alibaba Cloud": {
+        "compute": {"ecs.t5-lc1m1.small": 4.50, "ecs.t5-lc1m2.small": 9.00},
+        "database": {},
+        "storage": {"oss_gb": 0.02},
+        "networking": {},
+        "cdn": {"cdn_gb": 0.04}
+    },
+    "OVHcloud": {
+        "compute": {"d2-2": 13.00, "d2-4": 24.00},
+        "database": {},
+        "storage": {"object_storage_gb": 0.01},
+        "networking": {},
+        "cdn": {}
+    },
+    "Scaleway": {
+        "compute": {"dev1_s": 7.99, "dev1_m": 15.99},
+        "database": {},
+        "storage": {"object_storage_gb": 0.01},
+        "networking": {},
+        "cdn": {}
+    },
+    "Vercel": {
+        "compute": {"hobby": 0.00, "pro": 20.00},
+        "database": {},
+        "storage": {},
+        "networking": {},
+        "cdn": {}
+    },
+    "Oracle Cloud": {
+        "compute": {"vm_standard_e2_1": 40.00, "vm_standard_e2_2": 80.00},
+        "database": {"autonomous_db": 295.00},
+        "storage": {"object_storage_gb": 0.0255},
+        "networking": {},
+        "cdn": {}
+    },
+    "IBM Cloud": {
+        "compute": {"bx2_2x8": 65.00, "bx2_4x16": 130.00},
+        "database": {"databases_postgresql": 30.00},
+        "storage": {"object_storage_gb": 0.023},
+        "networking": {},
+        "cdn": {}
+    }
+}
+
+# Fail-fast limits for the AWS catalogue (normally ~10 MB) and for each attempt of a provider fetch
+AWS_TIMEOUT = httpx.Timeout(15.0, connect=5.0, write=5.0, pool=5.0)
+AWS_MAX_BYTES = 20 * 1024 * 1024
+PROVIDER_FETCH_TIMEOUT = 20
+
+# Application-level retries for transient upstream failures (network errors, timeouts, 5xx, 429);
+# full-jitter backoff. Permanent failures (4xx, bad bodies, oversized responses) are not retried.
+FETCH_ATTEMPTS = 3
+FETCH_RETRY_BASE_DELAY = 0.5
+FETCH_RETRY_MAX_DELAY = 5.0
+
+# Fixed pricing_history _ids, written alternately; latest_pricing.meta.archive_slot names the last one used
+HISTORY_SLOTS = ("backup_a", "backup_b")
+
+PRICING_CATEGORIES = ("compute", "database", "storage", "networking", "cdn")
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a failed upstream fetch is worth retrying"""
+    if isinstance(exc, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return False
+
+def _empty_pricing() -> dict:
+    """Fresh per-provider pricing skeleton: one empty dict per category"""
+    return {category: {} for category in PRICING_CATEGORIES}
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper over an httpx byte stream, as ijson's async parsers expect"""
+
+    def __init__(self, chunks, max_bytes: int = None):
+        self._chunks = chunks.__aiter__()
+        self._max_bytes = max_bytes
+        self._total = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson accepts chunks of any length; an empty read signals end of stream
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+        self._total += len(chunk)
+        if self._max_bytes is not None and self._total > self._max_bytes:
+            raise RuntimeError(f"Response exceeded {self._max_bytes} bytes")
+        return chunk
+
+async def _iter_json_array(response, max_bytes: int = None):
+    """Yield the items of a top-level JSON array response, incrementally when ijson is installed"""
+    reader = _AsyncByteReader(response.aiter_bytes(), max_bytes)
+    if ijson is not None:
+        async for item in ijson.items_async(reader, "item"):
+            yield item
+    else:
+        chunks = []
+        while chunk := await reader.read():
+            chunks.append(chunk)
+        for item in orjson.loads(b"".join(chunks)):
+            yield item
+
 class PricingFetcher:
     # API endpoints
     AZURE_API_URL = "https://prices.azure.com/api/retail/prices"
     AWS_API_URL = "https://www.ec2instances.info/instances.json"
+    CURRENCY_API_URL = "https://api.exchangerate-api.com/v4/latest/USD"
+
+    # HTTP validators (ETag / Last-Modified) per upstream source ("aws", "azure", "currency"),
+    # persisted in meta.http_validators so the next run can issue conditional GETs
+    http_validators: dict = {}
+
+    # Shared HTTP client (lazily created) so keep-alive connections are reused across runs
+    _client: httpx.AsyncClient = None
+
+    # In-flight refresh; concurrent fetch_latest_prices calls await this instead of starting another
+    _inflight: asyncio.Task = None
+
+    # In-process TTL cache of upstream responses: {url: (monotonic_fetched_at, result)}.
+    # TTLs stay under 24h so the daily job always refetches; manual refreshes in between reuse results.
+    CURRENCY_CACHE_TTL = 6 * 3600
+    CATALOGUE_CACHE_TTL = 12 * 3600
+    _cache: dict = {}
 
     @staticmethod
-    async def fetch_aws_prices(client):
-        """Fetch comprehensive AWS pricing data"""
+    async def _with_retries(source: str, fn, attempts: int = FETCH_ATTEMPTS, timeout: float = PROVIDER_FETCH_TIMEOUT):
+        """Call fn() with a per-attempt timeout, retrying transient failures with exponential backoff and jitter.
+        The fetchers re-raise transient errors and log + return None for permanent ones, so None is final.
+        Returns None once the attempts are exhausted."""
+        for attempt in range(attempts):
+            try:
+                return await asyncio.wait_for(fn(), timeout)
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                if attempt == attempts - 1:
+                    logger.error(f"Error fetching {source} after {attempts} attempts: {e!r}")
+                    return None
+                logger.warning(f"Transient error fetching {source} (attempt {attempt + 1}/{attempts}): {e!r}")
+            delay = min(FETCH_RETRY_MAX_DELAY, FETCH_RETRY_BASE_DELAY * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+
+    @classmethod
+    async def _cached(cls, key: str, ttl: float, fn):
+        """Return fn()'s result from the cache if younger than ttl; failed (None) results are not cached"""
+        hit = cls._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            logger.info(f"Using cached response for {key}")
+            return hit[1]
+        result = await fn()
+        if result is not None:
+            cls._cache[key] = (time.monotonic(), result)
+        return result
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use"""
+        if cls._client is None or cls._client.is_closed:
+            # http2/limits go on the transport: the client ignores its own when given one
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                # Keep idle connections for 5 minutes so back-to-back admin refreshes skip TCP/TLS setup
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=300),
+                retries=3  # Re-attempt failed connects (refused/reset/connect timeout)
+            )
+            cls._client = httpx.AsyncClient(
+                transport=transport,
+                # Prefer brotli for the multi-MB instances.json; httpx decodes it via the brotli extra
+                headers={"Accept-Encoding": "gzip, br"},
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+        return cls._client
+
+    @classmethod
+    async def close_client(cls):
+        """Close the shared AsyncClient (called on app shutdown)"""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+
+    @staticmethod
+    def _stored_validators(previous: dict, source: str, previous_data) -> dict:
+        """Validators saved for `source` by the last run; {} if there's no stored data a 304 could reuse"""
+        if not previous_data:
+            return {}
+        return previous.get("meta", {}).get("http_validators", {}).get(source) or {}
+
+    @staticmethod
+    def _conditional_headers(validators: dict) -> dict:
+        """If-None-Match / If-Modified-Since headers for the given validators"""
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    @classmethod
+    def _remember_validators(cls, source: str, response: httpx.Response):
+        """Record a fresh response's validators for the next run's conditional GET"""
+        cls.http_validators[source] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified")
+        }
+
+    @staticmethod
+    async def fetch_aws_prices(client, previous: dict = None):
+        """Fetch comprehensive AWS pricing data (conditional GET against the previous run)"""
         try:
             logger.info("Fetching detailed AWS prices from Vantage...")
-            response = await client.get(PricingFetcher.AWS_API_URL, timeout=30.0)
-            data = response.json()
-            
-            pricing = {
-                "compute": {},
-                "database": {},
-                "storage": {},
-                "networking": {},
-                "cdn": {}
-            }
+            previous = previous or {}
+            previous_aws = previous.get("providers", {}).get("AWS")
+            validators = PricingFetcher._stored_validators(previous, "aws", previous_aws)
+            pricing = _empty_pricing()
             
-            # Extract compute pricing for various instance types
-            for instance in data:
-                instance_type = instance.get('instance_type')
-                region_pricing = instance.get('pricing', {}).get('us-east-1', {}).get('linux', {})
-                ondemand = region_pricing.get('ondemand')
+            # Stream-parse the multi-MB catalogue one instance at a time instead of response.json()
+            async with client.stream(
+                "GET", PricingFetcher.AWS_API_URL,
+                headers=PricingFetcher._conditional_headers(validators), timeout=AWS_TIMEOUT
+            ) as response:
+                if response.status_code == 304:
+                    logger.info("AWS catalogue not modified upstream; reusing previous pricing")
+                    PricingFetcher.http_validators["aws"] = validators
+                    return previous_aws
+                response.raise_for_status()
+                PricingFetcher._remember_validators("aws", response)
                 
-                if ondemand and instance_type:
-                    hourly = float(ondemand)
-                    monthly = hourly * 730  # 730 hours/month average
+                async with aclosing(_iter_json_array(response, AWS_MAX_BYTES)) as instances:
+                    async for instance in instances:
+                        # Skip the nested pricing lookups for the ~99% of instance types we don't use
+                        instance_type = instance.get('instance_type')
+                        if instance_type not in AWS_COMPUTE_TYPES:
+                            continue
+                        ondemand = instance.get('pricing', {}).get('us-east-1', {}).get('linux', {}).get('ondemand')
+                        if not ondemand:
+                            continue
                     
-                    # Collect t3 family instances
-                    if instance_type in ['t3.micro', 't3.small', 't3.medium', 't3.large', 't3.xlarge']:
-                        pricing['compute'][instance_type] = monthly
+                        hourly = float(ondemand)
+                        pricing['compute'][instance_type] = hourly * HOURS_PER_MONTH
                     
-                    # Collect m5 family instances  
-                    elif instance_type in ['m5.large', 'm5.xlarge', 'm5.2xlarge']:
-                        pricing['compute'][instance_type] = monthly
+                        # Use t3.medium as baseline for RDS estimation
+                        if instance_type == 't3.medium':
+                            pricing['database'].update({k: hourly * f for k, f in RDS_HOURLY_FACTORS.items()})
+                            pricing['database']['dynamodb_unit'] = 1.25  # Per WCU/RCU unit
                     
-                    # Use t3.medium as baseline for RDS estimation
-                    if instance_type == 't3.medium':
-                        baseline = monthly
-                        # RDS is typically 1.5-2x compute cost
-                        pricing['database']['rds_db.t3.micro'] = baseline * 0.4
-                        pricing['database']['rds_db.t3.medium'] = baseline * 1.6
-                        pricing['database']['rds_db.t3.large'] = baseline * 3.2
-                        pricing['database']['dynamodb_unit'] = 1.25  # Per WCU/RCU unit
+                        # Every wanted type found: stop reading; leaving the block closes the stream
+                        if len(pricing['compute']) == len(AWS_COMPUTE_TYPES):
+                            break
             
             # AWS static pricing (from official pricing pages)
             pricing['storage']['s3_gb'] = 0.023  # S3 Standard
@@ -71,38 +456,44 @@ class PricingFetcher:
             logger.info(f"AWS pricing fetched: {len(pricing['compute'])} compute types")
             return pricing
         except Exception as e:
+            if _is_transient(e):
+                raise  # Retried by _with_retries
             logger.error(f"Error fetching AWS prices: {e}")
             return None
 
     @staticmethod
-    async def fetch_azure_prices(client):
-        """Fetch comprehensive Azure pricing from Retail API"""
+    async def fetch_azure_prices(client, previous: dict = None):
+        """Fetch comprehensive Azure pricing from Retail API (conditional GET against the previous run)"""
         try:
             logger.info("Fetching detailed Azure prices...")
-            pricing = {
-                "compute": {},
-                "database": {},
-                "storage": {},
-                "networking": {},
-                "cdn": {}
-            }
+            previous = previous or {}
+            previous_azure = previous.get("providers", {}).get("Azure")
+            validators = PricingFetcher._stored_validators(previous, "azure", previous_azure)
+            pricing = _empty_pricing()
             
-            # Fetch VM pricing for D-series (most common)
-            vm_query = "armRegionName eq 'eastus' and serviceName eq 'Virtual Machines' and priceType eq 'Consumption'"
-            response = await client.get(f"{PricingFetcher.AZURE_API_URL}?$filter={vm_query}", timeout=30.0)
-            data = response.json()
+            # Fetch VM pricing for the mapped D/B-series SKUs only (httpx URL-encodes the params)
+            response = await client.get(
+                PricingFetcher.AZURE_API_URL, params=AZURE_VM_PARAMS,
+                headers=PricingFetcher._conditional_headers(validators), timeout=30.0
+            )
+            if response.status_code == 304:
+                logger.info("Azure prices not modified upstream; reusing previous pricing")
+                PricingFetcher.http_validators["azure"] = validators
+                return previous_azure
+            response.raise_for_status()
+            PricingFetcher._remember_validators("azure", response)
+            data = orjson.loads(response.content)
             
-            for item in data.get('Items', [])[:20]:  # Limit to first 20 items
+            for item in data.get('Items', []):
                 sku = item.get('skuName', '')
-                price = item.get('retailPrice', 0)
+                # Keep the Linux on-demand row for each SKU
+                if 'Spot' in sku or 'Low Priority' in sku or 'Windows' in item.get('productName', ''):
+                    continue
                 
                 # Map Azure VMs to pricing
-                if 'D2s v3' in sku or 'D2 v3' in sku:
-                    pricing['compute']['d2s_v3'] = float(price) * 730
-                elif 'D4s v3' in sku or 'D4 v3' in sku:
-                    pricing['compute']['d4s_v3'] = float(price) * 730
-                elif 'B1s' in sku:
-                    pricing['compute']['b1s'] = float(price) * 730
+                key = next((k for fragment, k in AZURE_SKU_MAP if fragment in sku), None)
+                if key:
+                    pricing['compute'][key] = float(item.get('retailPrice', 0)) * HOURS_PER_MONTH
             
             # Azure static pricing (from official pricing)
             pricing['database']['sql_basic'] = 15.00  # Basic tier monthly
@@ -116,6 +507,8 @@ class PricingFetcher:
             logger.info(f"Azure pricing fetched: {len(pricing['compute'])} compute types")
             return pricing
         except Exception as e:
+            if _is_transient(e):
+                raise  # Retried by _with_retries
             logger.error(f"Error fetching Azure prices: {e}")
             return None
 
@@ -123,254 +516,110 @@ class PricingFetcher:
     async def fetch_gcp_prices(client):
         """Fetch GCP pricing (using static official pricing)"""
         logger.info("Loading GCP static pricing...")
-        # GCP official pricing (updated Q4 2024)
-        return {
-            "compute": {
-                "e2-micro": 6.11,  # Monthly
-                "e2-small": 12.23,
-                "e2-medium": 24.45,
-                "e2-standard-2": 48.90,
-                "n1-standard-1": 24.27,
-                "n1-standard-2": 48.54,
-            },
-            "database": {
-                "cloud_sql_micro": 7.67,  # db-f1-micro
-                "cloud_sql_small": 25.00,  # db-g1-small  
-                "cloud_sql_standard": 107.30,  # db-n1-standard-1
-                "firestore_gb": 0.18,  # Per GB
-            },
-            "storage": {
-                "standard_gb": 0.020,  # Cloud Storage Standard
-                "nearline_gb": 0.010,  # Nearline
-                "coldline_gb": 0.004,  # Coldline
-            },
-            "networking": {
-                "load_balancer": 18.26,  # Cloud Load Balancer
-                "egress_gb": 0.12,  # First tier egress
-            },
-            "cdn": {
-                "cloud_cdn_gb": 0.08,  # Cloud CDN
-            }
-        }
+        return GCP_STATIC_PRICING
 
     @staticmethod
     async def fetch_digitalocean_prices(client):
         """Fetch DigitalOcean pricing (static from documentation)"""
         logger.info("Loading DigitalOcean static pricing...")
-        # DigitalOcean official pricing (updated Q4 2024)
-        return {
-            "compute": {
-                "basic_1gb": 6.00,  # Basic droplet 1GB
-                "basic_2gb": 12.00,  # Basic droplet 2GB
-                "basic_4gb": 24.00,  # Basic droplet 4GB
-                "general_2gb": 18.00,  # General Purpose 2GB
-                "general_4gb": 36.00,  # General Purpose 4GB
-            },
-            "database": {
-                "managed_db_1gb": 15.00,  # Managed Database 1GB  
-                "managed_db_2gb": 30.00,  # Managed Database 2GB
-                "managed_db_4gb": 60.00,  # Managed Database 4GB
-            },
-            "storage": {
-                "spaces_gb": 0.02,  # Spaces (S3-compatible)
-                "block_storage_gb": 0.10,  # Block Storage
-            },
-            "networking": {
-                "load_balancer": 12.00,  # Load Balancer monthly
-                "bandwidth_gb": 0.01,  # Overage bandwidth
-            },
-            "cdn": {
-                "cdn_gb": 0.01,  # CDN bandwidth
-            }
-        }
+        return DIGITALOCEAN_STATIC_PRICING
 
     @staticmethod
     async def fetch_hetzner_prices(client):
         """Jet Hetzner pricing (static from documentation)"""
         logger.info("Loading Hetzner static pricing...")
-        return {
-            "compute": {
-                "cx11": 3.29,  # 1 vCPU, 2GB RAM
-                "cx21": 5.83,  # 2 vCPU, 4GB RAM
-                "cx31": 11.17,  # 2 vCPU, 8GB RAM
-                "cx41": 21.34,  #  4 vCPU, 16GB RAM
-            },
-            "database": {
-                "managed_postgresql_1gb": 10.00,
-                "managed_mysql_1gb": 10.00,
-            },
-            "storage": {
-                "volume_gb": 0.04,  # Block storage per GB
-                "snapshot_gb": 0.01,  # Snapshot per GB
-            },
-            "networking": {
-                "load_balancer": 4.90,  # Load Balancer monthly
-                "traffic_gb": 0.011,  # Outbound traffic
-            },
-            "cdn": {}
-        }
+        return HETZNER_STATIC_PRICING
 
     @staticmethod
     async def fetch_other_provider_prices():
         """Fetch pricing for remaining providers (static)"""
         logger.info("Loading pricing for other providers...")
-        return {
-            "Linode": {
-                "compute": {"nanode_1gb": 5.00, "linode_2gb": 10.00, "linode_4gb": 20.00},
-                "database": {"managed_db_1gb": 15.00},
-                "storage": {"block_storage_gb": 0.10},
-                "networking": {"lb_monthly": 10.00},
-                "cdn": {}
-            },
-            "Vultr": {
-                "compute": {"vc2_1c_1gb": 6.00, "vc2_2c_4gb": 18.00},
-                "database": {"managed_db_1gb": 15.00},
-                "storage": {"block_storage_gb": 0.10},
-                "networking": {},
-                "cdn": {}
-            },
-            # Indian Providers
-            "Tata IZO": {
-                "compute": {"small": 15.00, "medium": 30.00},
-                "database": {},
-                "storage": {"storage_gb": 0.03},
-                "networking": {},
-                "cdn": {}
-            },
-            "CtrlS": {
-                "compute": {"small": 18.00, "medium": 35.00},
-                "database": {},
-                "storage": {"storage_gb": 0.03},
-                "networking": {},
-                "cdn": {}
-            },
-            "Netmagic": {
-                "compute": {"small": 20.00, "medium": 40.00},
-                "database": {},
-                "storage": {"storage_gb": 0.04},
-                "networking": {},
-                "cdn": {}
-            },
-            "Yotta": {
-                "compute": {"small": 16.00, "medium": 32.00},
-                "database": {},
-                "storage": {"storage_gb": 0.03},
-                "networking": {},
-                "cdn": {}
-            },
-            # Regional providers  
-            "Alibaba Cloud": {
-                "compute": {"ecs.t5-lc1m1.small": 4.50, "ecs.t5-lc1m2.small": 9.00},
-                "database": {},
-                "storage": {"oss_gb": 0.02},
-                "networking": {},
-                "cdn": {"cdn_gb": 0.04}
-            },
-            "OVHcloud": {
-                "compute": {"d2-2": 13.00, "d2-4": 24.00},
-                "database": {},
-                "storage": {"object_storage_gb": 0.01},
-                "networking": {},
-                "cdn": {}
-            },
-            "Scaleway": {
-                "compute": {"dev1_s": 7.99, "dev1_m": 15.99},
-                "database": {},
-                "storage": {"object_storage_gb": 0.01},
-                "networking": {},
-                "cdn": {}
-            },
-            "Vercel": {
-                "compute": {"hobby": 0.00, "pro": 20.00},
-                "database": {},
-                "storage": {},
-                "networking": {},
-                "cdn": {}
-            },
-            "Oracle Cloud": {
-                "compute": {"vm_standard_e2_1": 40.00, "vm_standard_e2_2": 80.00},
-                "database": {"autonomous_db": 295.00},
-                "storage": {"object_storage_gb": 0.0255},
-                "networking": {},
-                "cdn": {}
-            },
-            "IBM Cloud": {
-                "compute": {"bx2_2x8": 65.00, "bx2_4x16": 130.00},
-                "database": {"databases_postgresql": 30.00},
-                "storage": {"object_storage_gb": 0.023},
-                "networking": {},
-                "cdn": {}
-            }
-        }
+        return OTHER_PROVIDER_STATIC_PRICING
 
     @staticmethod
-    async def fetch_currency_rates(client):
-        """Fetch real-time currency exchange rates"""
+    async def fetch_currency_rates(client, previous: dict = None):
+        """Fetch real-time currency exchange rates (conditional GET against the previous run)"""
         try:
             logger.info("Fetching currency exchange rates...")
-            response = await client.get("https://api.exchangerate-api.com/v4/latest/USD", timeout=15.0)
-            data = response.json()
+            previous = previous or {}
+            validators = PricingFetcher._stored_validators(previous, "currency", previous.get("currency_rates"))
+            
+            response = await client.get(
+                PricingFetcher.CURRENCY_API_URL,
+                headers=PricingFetcher._conditional_headers(validators), timeout=15.0
+            )
+            if response.status_code == 304:
+                logger.info("Currency rates not modified upstream; reusing previous rates")
+                PricingFetcher.http_validators["currency"] = validators
+                return previous["currency_rates"]
+            response.raise_for_status()
+            data = orjson.loads(response.content)
             
             if data and 'rates' in data:
                 rates = data['rates']
-                supported_currencies = [
-                    "USD", "CAD", "MXN", "BRL", "ARS", "EUR", "GBP", "CHF", 
-                    "INR", "JPY", "CNY", "KRW", "SGD", "HKD", "AUD", "NZD",
-                    "AED", "SAR", "ZAR"
-                ]
-                
-                currency_rates = {"USD": 1.0}
-                for currency in supported_currencies:
-                    if currency != "USD" and currency in rates:
-                        currency_rates[currency] = rates[currency]
+                # Set intersection with the keys view picks the supported codes in one C-level pass
+                currency_rates = {"USD": 1.0, **{c: rates[c] for c in SUPPORTED_CURRENCIES & rates.keys()}}
+                PricingFetcher._remember_validators("currency", response)
                 
                 logger.info(f"Fetched {len(currency_rates)} currency rates")
                 return currency_rates
             return None
         except Exception as e:
+            if _is_transient(e):
+                raise  # Retried by _with_retries
             logger.error(f"Error fetching currency rates: {e}")
             return None
 
     @staticmethod
-    async def archive_current_pricing(db):
-        """Archive current pricing to history (keep only 2 backups max)"""
+    async def archive_current_pricing(db, archived_at: str = None, slot: str = HISTORY_SLOTS[0]):
+        """Archive current pricing into one of the two fixed history slots (keep only 2 backups max)"""
         try:
-            current = await db.pricing.find_one({"_id": "latest_pricing"})
-            if current:
-                # Remove _id and add archive timestamp
-                current.pop("_id", None)
-                current["archived_at"] = datetime.now().isoformat()
-                
-                # Get count of historical backups
-                history_count = await db.pricing_history.count_documents({})
-                
-                # If we already have 2 backups, remove the oldest one
-                if history_count >= 2:
-                    # Sort by archived_at and delete the oldest
-                    oldest = await db.pricing_history.find_one(
-                        sort=[("archived_at", 1)]
-                    )
-                    if oldest:
-                        await db.pricing_history.delete_one({"_id": oldest["_id"]})
-                        logger.info(f"Removed oldest backup to maintain max 2 copies")
-                
-                # Insert current pricing as new backup
-                result = await db.pricing_history.insert_one(current)
-                logger.info(f"Archived pricing backup {result.inserted_id}. Total backups: {history_count + 1} (capped at 2)")
-                return True
+            # Copy latest_pricing into history server-side (no round-trip of the document itself),
+            # replacing whatever the slot held so the rotation needs no count, sort or delete
+            await db.pricing.aggregate([
+                {"$match": {"_id": "latest_pricing"}},
+                {"$addFields": {"_id": slot, "archived_at": archived_at or datetime.now().isoformat()}},
+                {"$merge": {"into": "pricing_history", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+            ]).to_list(length=None)
+            logger.info(f"Archived pricing backup to {slot}")
+            return True
         except Exception as e:
             logger.error(f"Error archiving pricing: {e}")
         return False
 
     @staticmethod
-    async def track_job_status(db, status: str, error: str = None, metadata: dict = None):
-        """Track job execution status for admin dashboard"""
+    async def prune_pricing_history(db, seed_slot: str = None):
+        """Remove history documents outside the rolling slots (e.g. backups from before slots were used).
+        With seed_slot, the newest such legacy backup is first copied into that empty slot, so the first
+        slotted run still leaves two backups."""
         try:
-            current_time = datetime.now()
+            if seed_slot:
+                await db.pricing_history.aggregate([
+                    {"$match": {"_id": {"$nin": list(HISTORY_SLOTS)}}},
+                    {"$sort": {"archived_at": -1}},
+                    {"$limit": 1},
+                    {"$addFields": {"_id": seed_slot}},
+                    {"$merge": {"into": "pricing_history", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+                ]).to_list(length=None)
+            result = await db.pricing_history.delete_many({"_id": {"$nin": list(HISTORY_SLOTS)}})
+            if result.deleted_count:
+                logger.info(f"Removed {result.deleted_count} old backup(s) to maintain max {len(HISTORY_SLOTS)} copies")
+            return True
+        except Exception as e:
+            logger.error(f"Error pruning pricing history: {e}")
+        return False
+
+    @staticmethod
+    async def track_job_status(db, status: str, error: str = None, metadata: dict = None, ts: tuple = None):
+        """Track job execution status for admin dashboard (ts: optional (iso, epoch) from the caller's run)"""
+        try:
+            if ts is None:
+                current_time = datetime.now()
+                ts = (current_time.isoformat(), current_time.timestamp())
             job_data = {
                 "_id": "pricing_job_status",
-                "last_run": current_time.isoformat(),
-                "last_run_timestamp": current_time.timestamp(),
+                "last_run": ts[0],
+                "last_run_timestamp": ts[1],
                 "status": status,  # "success" or "failed"
                 "duration_seconds": None,
             }
@@ -384,6 +633,7 @@ class PricingFetcher:
             if metadata:
                 job_data.update(metadata)
             
+            # Acknowledged write: the gathered success status must have landed before a failure status follows
             await db.job_status.update_one(
                 {"_id": "pricing_job_status"},
                 {"$set": job_data},
@@ -399,108 +649,195 @@ class PricingFetcher:
             logger.error(f"Error tracking job status: {e}")
         return False
 
-    @staticmethod
-    async def fetch_latest_prices():
+    @classmethod
+    async def fetch_latest_prices(cls):
         """
-        Fetches comprehensive multi-cloud pricing and updates MongoDB
+        Fetches comprehensive multi-cloud pricing and updates MongoDB.
+        Calls made while a refresh is already running share its result (single-flight).
         """
+        if cls._inflight is None or cls._inflight.done():
+            cls._inflight = asyncio.create_task(cls._fetch_latest_prices())
+        else:
+            logger.info("Price refresh already in progress; waiting for it")
+        # Shield so a cancelled caller doesn't cancel the refresh other callers are awaiting
+        return await asyncio.shield(cls._inflight)
+
+    @staticmethod
+    async def _fetch_latest_prices():
+        """Run one full fetch + archive + save cycle (use fetch_latest_prices)"""
         logger.info("Starting comprehensive multi-cloud price fetch...")
         
+        # Resolved once; the failure path below reuses the same handle
+        db = await get_database()
         try:
-            async with httpx.AsyncClient() as client:
-                # Fetch prices from all sources
-                aws_pricing = await PricingFetcher.fetch_aws_prices(client)
-                azure_pricing = await PricingFetcher.fetch_azure_prices(client)
-                gcp_pricing = await PricingFetcher.fetch_gcp_prices(client)
-                digitalocean_pricing = await PricingFetcher.fetch_digitalocean_prices(client)
-                hetzner_pricing = await PricingFetcher.fetch_hetzner_prices(client)
-                other_providers = await PricingFetcher.fetch_other_provider_prices()
-                currency_rates = await PricingFetcher.fetch_currency_rates(client)
-                
-                # Default currency rates if fetch failed
-                if not currency_rates:
-                    currency_rates = {
-                        "USD": 1.0, "INR": 84.0, "EUR": 0.92, "GBP": 0.79,
-                        "JPY": 150.0, "CNY": 7.2, "AUD": 1.52
-                    }
-                
-                # Build comprehensive pricing data structure
-                pricing_data = {
-                    "providers": {
-                        "AWS": aws_pricing or {},
-                        "Azure": azure_pricing or {},
-                        "GCP": gcp_pricing or {},
-                        "DigitalOcean": digitalocean_pricing or {},
-                        "Hetzner": hetzner_pricing or {},
-                        **other_providers
-                    },
-                    "currency_rates": currency_rates,
-                    "meta": {
-                        "last_updated": datetime.now().isoformat(),
-                        "sources": ["AWS-Vantage", "Azure-Retail-API", "ExchangeRate-API", "Static-Documentation"],
-                        "version": "2.0"
+            client = PricingFetcher.get_client()
+            
+            # Previous AWS/Azure/currency data + HTTP validators let those fetches use conditional GETs
+            previous = None
+            if db is not None:
+                previous = await db.pricing.find_one(
+                    {"_id": "latest_pricing"},
+                    projection={
+                        "providers.AWS": 1,
+                        "providers.Azure": 1,
+                        "currency_rates": 1,
+                        "meta.http_validators": 1,
+                        "meta.content_hash": 1,
+                        "meta.archive_slot": 1
                     }
-                }
-                
-                # Save to MongoDB with backup
-                db = await get_database()
+                )
+
+            # Fetch prices from all sources concurrently; wall time is the slowest request, not the sum.
+            # Each live fetch attempt is capped inside _with_retries, so one stalled upstream can't hold up the refresh
+            fetches = (
+                PricingFetcher._cached(
+                    PricingFetcher.AWS_API_URL, PricingFetcher.CATALOGUE_CACHE_TTL,
+                    lambda: PricingFetcher._with_retries("AWS prices", lambda: PricingFetcher.fetch_aws_prices(client, previous))
+                ),
+                PricingFetcher._cached(
+                    PricingFetcher.AZURE_API_URL, PricingFetcher.CATALOGUE_CACHE_TTL,
+                    lambda: PricingFetcher._with_retries("Azure prices", lambda: PricingFetcher.fetch_azure_prices(client, previous))
+                ),
+                PricingFetcher.fetch_gcp_prices(client),
+                PricingFetcher.fetch_digitalocean_prices(client),
+                PricingFetcher.fetch_hetzner_prices(client),
+                PricingFetcher.fetch_other_provider_prices(),
+                PricingFetcher._cached(
+                    PricingFetcher.CURRENCY_API_URL, PricingFetcher.CURRENCY_CACHE_TTL,
+                    lambda: PricingFetcher._with_retries("currency rates", lambda: PricingFetcher.fetch_currency_rates(client, previous))
+                ),
+            )
+            results = await asyncio.gather(*fetches, return_exceptions=True)
+            (aws_pricing, azure_pricing, gcp_pricing, digitalocean_pricing,
+             hetzner_pricing, other_providers, currency_rates) = [
+                None if isinstance(result, Exception) else result for result in results
+            ]
+            
+            # Every live source failed: the result would be static tables plus default rates, so keep what's stored
+            if not (aws_pricing or azure_pricing or currency_rates):
+                logger.warning("All upstream pricing fetches failed; skipping archive and update")
                 if db is not None:
-                    try:
-                        # Archive current version
-                        await PricingFetcher.archive_current_pricing(db)
-                        
-                        # Update current pricing
-                        result = await db.pricing.update_one(
+                    await PricingFetcher.track_job_status(db, "skipped", error="All upstream pricing fetches failed")
+                return True
+            
+            # Default currency rates if fetch failed (and drop validators so the defaults are never reused on 304)
+            if not currency_rates:
+                PricingFetcher.http_validators.pop("currency", None)
+                currency_rates = dict(DEFAULT_CURRENCY_RATES)  # Same built-in rates PricingService starts from
+            
+            # One timestamp for this run, shared by meta, the archive entry and the job status
+            now = datetime.now()
+            now_iso, now_ts = now.isoformat(), now.timestamp()
+            
+            # Build comprehensive pricing data structure
+            pricing_data = {
+                "providers": {
+                    "AWS": aws_pricing or {},
+                    "Azure": azure_pricing or {},
+                    "GCP": gcp_pricing or {},
+                    "DigitalOcean": digitalocean_pricing or {},
+                    "Hetzner": hetzner_pricing or {},
+                    **(other_providers or {})
+                },
+                "currency_rates": currency_rates,
+            }
+            # Hash of everything except meta (which carries the timestamp), to detect no-op runs
+            content_hash = hashlib.sha1(orjson.dumps(pricing_data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+            # Archive into whichever slot the previous run didn't use, so the two newest backups survive
+            last_slot = (previous or {}).get("meta", {}).get("archive_slot")
+            archive_slot = HISTORY_SLOTS[1] if last_slot == HISTORY_SLOTS[0] else HISTORY_SLOTS[0]
+            # No slot used yet (first run after slots were introduced): fill the other slot from legacy history
+            seed_slot = None if last_slot else HISTORY_SLOTS[1]
+            pricing_data["meta"] = {
+                "last_updated": now_iso,
+                "sources": ["AWS-Vantage", "Azure-Retail-API", "ExchangeRate-API", "Static-Documentation"],
+                "version": "2.0",
+                "http_validators": PricingFetcher.http_validators,
+                "content_hash": content_hash,
+                "archive_slot": archive_slot
+            }
+            
+            # Identical to what is stored: skip the archive copy and the full rewrite, but still record
+            # this run's timestamp and the fresh HTTP validators so later conditional GETs aren't stale
+            if db is not None and previous and previous.get("meta", {}).get("content_hash") == content_hash:
+                logger.info("Pricing unchanged since last run; skipping archive and update")
+                await db.pricing.update_one(
+                    {"_id": "latest_pricing"},
+                    {"$set": {
+                        "meta.last_updated": now_iso,
+                        "meta.http_validators": PricingFetcher.http_validators
+                    }}
+                )
+                await PricingFetcher.track_job_status(
+                    db,
+                    "success",
+                    metadata={"pricing_unchanged": True},
+                    ts=(now_iso, now_ts)
+                )
+                return True
+            
+            # Save to MongoDB with backup
+            if db is not None:
+                try:
+                    # Archive current version (must complete before latest_pricing is overwritten)
+                    await PricingFetcher.archive_current_pricing(db, now_iso, archive_slot)
+                    
+                    # Trimming history, updating current pricing and recording the job status touch
+                    # different collections, so they run concurrently (one round-trip instead of three)
+                    total_providers = len(pricing_data["providers"])
+                    job_metadata = {
+                        "sources_fetched": len(pricing_data["meta"]["sources"]),
+                        "currencies_updated": len(currency_rates),
+                        "providers_updated": total_providers,
+                        "pricing_version": "2.0",
+                        "pricing_unchanged": False
+                    }
+                    # return_exceptions so every write has settled before a failure status is recorded
+                    _, result, _ = await asyncio.gather(
+                        PricingFetcher.prune_pricing_history(db, seed_slot),
+                        db.pricing.replace_one(
                             {"_id": "latest_pricing"},
-                            {"$set": pricing_data},
+                            pricing_data,
                             upsert=True
-                        )
-                        
-                        if result.matched_count > 0 or result.upserted_id:
-                            # Track success
-                            total_providers = len(pricing_data["providers"])
-                            job_metadata = {
-                                "sources_fetched": len(pricing_data["meta"]["sources"]),
-                                "currencies_updated": len(currency_rates),
-                                "providers_updated": total_providers,
-                                "pricing_version": "2.0"
-                            }
-                            
-                            await PricingFetcher.track_job_status(
-                                db, 
-                                "success",
-                                metadata=job_metadata
-                            )
-                            
-                            logger.info(f"✅ Successfully updated comprehensive pricing. Providers: {total_providers}, Currencies: {len(currency_rates)}")
-                            return True
-                        else:
-                            logger.warning("Update operation completed but no documents were modified")
-                            await PricingFetcher.track_job_status(
-                                db, 
-                                "warning",
-                                error="No documents were updated"
-                            )
-                            return False
-                            
-                    except Exception as db_error:
-                        logger.error(f"Database operation failed: {db_error}")
+                        ),
+                        PricingFetcher.track_job_status(
+                            db, 
+                            "success",
+                            metadata=job_metadata,
+                            ts=(now_iso, now_ts)
+                        ),
+                        return_exceptions=True
+                    )
+                    if isinstance(result, Exception):
+                        raise result
+                    
+                    if result.modified_count or result.upserted_id:
+                        logger.info(f"✅ Successfully updated comprehensive pricing. Providers: {total_providers}, Currencies: {len(currency_rates)}")
+                        return True
+                    else:
+                        logger.warning("Update operation completed but no documents were modified")
                         await PricingFetcher.track_job_status(
                             db, 
-                            "failed", 
-                            error=str(db_error)
+                            "warning",
+                            error="No documents were updated",
+                            ts=(now_iso, now_ts)
                         )
                         return False
-                else:
-                    logger.error("Database not available")
+                        
+                except Exception as db_error:
+                    logger.error(f"Database operation failed: {db_error}")
+                    await PricingFetcher.track_job_status(
+                        db, 
+                        "failed", 
+                        error=str(db_error)
+                    )
                     return False
-                
+            else:
+                logger.error("Database not available")
+                return False
+            
         except Exception as e:
             logger.error(f"Failed to fetch prices: {str(e)}")
-            try:
-                db = await get_database()
-                if db:
-                    await PricingFetcher.track_job_status(db, "failed", error=str(e))
-            except:
-                pass
+            if db is not None:
+                await PricingFetcher.track_job_status(db, "failed", error=str(e))
             return False
@@ -1,12 +1,47 @@
-import json
 import os
 import logging
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from currencies import DEFAULT_CURRENCY_RATES, DEFAULT_CURRENCY_SYMBOLS
 
 logger = logging.getLogger(__name__)
 
+# Multipliers relative to AWS (Extended to 17 providers); read-only, PricingService keeps a mutable copy
+DEFAULT_CLOUD_MULTIPLIERS = MappingProxyType({
+    # Major Global
+    "AWS": 1.0,
+    "Azure": 1.05,  # Slightly premium for enterprise features
+    "GCP": 0.95,    # Sustained use discounts
+    "Oracle Cloud": 0.90,  # Competitive enterprise pricing
+    "IBM Cloud": 1.10,  # Premium for enterprise/mainframe
+
+    # Developer-Focused
+    "DigitalOcean": 0.60,  # Simple, developer-friendly
+    "Linode": 0.65,  # Predictable pricing
+    "Vultr": 0.62,  # Aggressive pricing
+    "Hetzner": 0.50,  # Very cost-effective
+
+    # Indian Providers
+    "Tata IZO": 0.85,  # Competitive in Indian market
+    "CtrlS": 0.80,  # Cost-effective Indian option
+    "Netmagic": 0.90,  # Managed services premium  
+    "Yotta": 0.75,  # Competitive hyperscale pricing
+
+    # Regional/Specialized
+    "Alibaba Cloud": 0.70,  # Competitive in APAC
+    "OVHcloud": 0.55,  # European value leader
+    "Scaleway": 0.58,  # Competitive European pricing
+    "Vercel": 1.25  # Premium for managed edge/serverless
+})
+
 class PricingService:
     PRICING_FILE = "pricing_data.json"
 
+    # Version of the loaded pricing data (epoch microseconds of meta.last_updated, 0 = defaults).
+    # Estimates are a function of (input, pricing data), so this is folded into ETags.
+    PRICING_VERSION = 0
+
     # Real-world pricing approximations (AWS us-east-1, 2025 estimates)
     # These serve as defaults/fallbacks
     PRICING = {
@@ -103,31 +138,47 @@ class PricingService:
 
     @classmethod
     async def load_dynamic_prices(cls):
-        """Loads pricing from MongoDB if available."""
+        """
+        Loads pricing from MongoDB if available.
+        The full document is only read when its version is newer than what's loaded.
+        """
         from database import get_database
         
         try:
             logger.info("Attempting to load dynamic pricing from database...")
             db = await get_database()
             if db is not None:
-                data = await db.pricing.find_one({"_id": "latest_pricing"})
+                # Cheap version probe first; never overwrite with a copy that isn't newer
+                stored = await db.pricing.find_one({"_id": "latest_pricing"}, projection={"meta.last_updated": 1})
+                version = cls._version_from_meta(stored.get("meta", {})) if stored else 0
+                if stored and version and version <= cls.PRICING_VERSION:
+                    logger.info("Dynamic pricing already up to date")
+                    return
+                
+                # Per-provider breakdowns aren't applied here, so don't transfer them
+                data = await db.pricing.find_one({"_id": "latest_pricing"}, projection={"providers": 0})
                 if data:
-                    # Update PRICING dict with loaded data
+                    # Update PRICING / multipliers / rates with loaded data via one category -> update() table
+                    apply = {
+                        **{category: prices.update for category, prices in cls.PRICING.items()},
+                        "multi_cloud": cls.CLOUD_MULTIPLIERS.update,
+                        "currency_rates": cls.CURRENCY_RATES.update,
+                    }
                     categories_updated = []
                     for category, items in data.items():
-                        if category in cls.PRICING and isinstance(items, dict):
-                            cls.PRICING[category].update(items)
+                        update = apply.get(category)
+                        if update is not None and isinstance(items, dict):
+                            update(items)
                             categories_updated.append(category)
-                        elif category == "multi_cloud":
-                            logger.info(f"Loading multi_cloud multipliers from DB: {items}")
-                            cls.CLOUD_MULTIPLIERS.update(items)
-                            categories_updated.append("multi_cloud")
-                            logger.info(f"CLOUD_MULTIPLIERS after update: {cls.CLOUD_MULTIPLIERS}")
-                        elif category == "currency_rates":
-                            cls.CURRENCY_RATES.update(items)
-                            categories_updated.append("currency_rates")
+                    if "currency_rates" in categories_updated:
+                        cls._rate.cache_clear()
+                    if "multi_cloud" in categories_updated:
+                        cls.CLOUD_MULTIPLIER_ITEMS = tuple(cls.CLOUD_MULTIPLIERS.items())
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"CLOUD_MULTIPLIERS after update: {cls.CLOUD_MULTIPLIERS}")
                             
                     meta = data.get('meta', {})
+                    cls.PRICING_VERSION = cls._version_from_meta(meta)
                     logger.info(f"✅ Loaded dynamic pricing from MongoDB")
                     logger.info(f"   Source: {meta.get('sources', 'Unknown')}")
                     logger.info(f"   Last Updated: {meta.get('last_updated', 'Unknown')}")
@@ -141,159 +192,39 @@ class PricingService:
             import traceback
             logger.error(traceback.format_exc())
 
+    @staticmethod
+    def _version_from_meta(meta: dict) -> int:
+        """Derive a monotonic integer version from meta.last_updated (0 if unknown).
+        Keeps the full microsecond precision so two writes within the same second still differ."""
+        last_updated = meta.get("last_updated")
+        if not last_updated:
+            return 0
+        try:
+            return round(datetime.fromisoformat(last_updated).timestamp() * 1_000_000)
+        except (TypeError, ValueError):
+            return 0
 
 
-    CURRENCY_RATES = {
-        # Americas
-        "USD": 1.0,
-        "CAD": 1.35,
-        "MXN": 17.0,
-        "BRL": 5.0,
-        "ARS": 350.0,
-        "CLP": 900.0,
-        "COP": 4000.0,
-        "PEN": 3.7,
-        
-        # Europe
-        "EUR": 0.92,
-        "GBP": 0.79,
-        "CHF": 0.88,
-        "SEK": 10.5,
-        "NOK": 10.8,
-        "DKK": 6.9,
-        "PLN": 4.0,
-        "CZK": 23.0,
-        "HUF": 360.0,
-        "RON": 4.6,
-        "BGN": 1.8,
-        "HRK": 6.9,
-        "TRY": 32.0,
-        "RUB": 92.0,
-        
-        # Asia-Pacific
-        "INR": 84.0,
-        "JPY": 150.0,
-        "CNY": 7.2,
-        "KRW": 1320.0,
-        "SGD": 1.34,
-        "HKD": 7.8,
-        "TWD": 31.5,
-        "THB": 35.0,
-        "MYR": 4.5,
-        "IDR": 15700.0,
-        "PHP": 56.0,
-        "VND": 24500.0,
-        "PKR": 278.0,
-        "BDT": 110.0,
-        "LKR": 305.0,
-        "AUD": 1.52,
-        "NZD": 1.68,
-        
-        # Middle East & Africa
-        "AED": 3.67,
-        "SAR": 3.75,
-        "QAR": 3.64,
-        "KWD": 0.31,
-        "BHD": 0.38,
-        "ILS": 3.65,
-        "EGP": 49.0,
-        "ZAR": 18.5,
-        "NGN": 1550.0,
-        "KES": 129.0
-    }
+    # Mutable copy: load_dynamic_prices applies DB rates on top of the defaults
+    CURRENCY_RATES = dict(DEFAULT_CURRENCY_RATES)
 
-    CURRENCY_SYMBOLS = {
-        # Americas
-        "USD": "$",
-        "CAD": "C$",
-        "MXN": "Mex$",
-        "BRL": "R$",
-        "ARS": "ARS$",
-        "CLP": "CLP$",
-        "COP": "COL$",
-        "PEN": "S/",
-        
-        # Europe
-        "EUR": "€",
-        "GBP": "£",
-        "CHF": "CHF",
-        "SEK": "kr",
-        "NOK": "kr",
-        "DKK": "kr",
-        "PLN": "zł",
-        "CZK": "Kč",
-        "HUF": "Ft",
-        "RON": "lei",
-        "BGN": "лв",
-        "HRK": "kn",
-        "TRY": "₺",
-        "RUB": "₽",
-        
-        # Asia-Pacific
-        "INR": "₹",
-        "JPY": "¥",
-        "CNY": "¥",
-        "KRW": "₩",
-        "SGD": "S$",
-        "HKD": "HK$",
-        "TWD": "NT$",
-        "THB": "฿",
-        "MYR": "RM",
-        "IDR": "Rp",
-        "PHP": "₱",
-        "VND": "₫",
-        "PKR": "₨",
-        "BDT": "৳",
-        "LKR": "Rs",
-        "AUD": "A$",
-        "NZD": "NZ$",
-        
-        # Middle East & Africa
-        "AED": "د.إ",
-        "SAR": "﷼",
-        "QAR": "ر.ق",
-        "KWD": "د.ك",
-        "BHD": "د.ب",
-        "ILS": "₪",
-        "EGP": "£",
-        "ZAR": "R",
-        "NGN": "₦",
-        "KES": "KSh"
-    }
+    CURRENCY_SYMBOLS = DEFAULT_CURRENCY_SYMBOLS  # Never updated at runtime, so shared read-only
 
-    # Multipliers relative to AWS (Extended to 17 providers)
-    CLOUD_MULTIPLIERS = {
-        # Major Global
-        "AWS": 1.0,
-        "Azure": 1.05,  # Slightly premium for enterprise features
-        "GCP": 0.95,    # Sustained use discounts
-        "Oracle Cloud": 0.90,  # Competitive enterprise pricing
-        "IBM Cloud": 1.10,  # Premium for enterprise/mainframe
-        
-        # Developer-Focused
-        "DigitalOcean": 0.60,  # Simple, developer-friendly
-        "Linode": 0.65,  # Predictable pricing
-        "Vultr": 0.62,  # Aggressive pricing
-        "Hetzner": 0.50,  # Very cost-effective
-        
-        # Indian Providers
-        "Tata IZO": 0.85,  # Competitive in Indian market
-        "CtrlS": 0.80,  # Cost-effective Indian option
-        "Netmagic": 0.90,  # Managed services premium  
-        "Yotta": 0.75,  # Competitive hyperscale pricing
-        
-        # Regional/Specialized
-        "Alibaba Cloud": 0.70,  # Competitive in APAC
-        "OVHcloud": 0.55,  # European value leader
-        "Scaleway": 0.58,  # Competitive European pricing
-        "Vercel": 1.25  # Premium for managed edge/serverless
-    }
+    # Mutable copy: load_dynamic_prices applies DB overrides on top of the defaults
+    CLOUD_MULTIPLIERS = dict(DEFAULT_CLOUD_MULTIPLIERS)
+    # (provider, multiplier) pairs for per-estimate loops; rebuilt by load_dynamic_prices, never per request
+    CLOUD_MULTIPLIER_ITEMS = tuple(CLOUD_MULTIPLIERS.items())
 
     @staticmethod
     def get_price(category: str, item: str) -> float:
         return PricingService.PRICING.get(category, {}).get(item, 0.0)
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _rate(target_currency: str) -> float:
+        """Rate for a currency code; memoized, cleared by load_dynamic_prices when rates change"""
+        return PricingService.CURRENCY_RATES.get(target_currency.upper(), 1.0)
+
     @staticmethod
     def convert(amount_usd: float, target_currency: str) -> float:
-        rate = PricingService.CURRENCY_RATES.get(target_currency.upper(), 1.0)
-        return amount_usd * rate
+        return amount_usd * PricingService._rate(target_currency)
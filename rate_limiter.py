@@ -1,12 +1,24 @@
 """
 Rate limiting middleware using slowapi
 """
+import os
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+# Shared counters in Redis when REDIS_URL is set, so limits hold across all workers;
+# per-process memory otherwise (local dev)
+RATE_LIMIT_STORAGE_URI = os.getenv("REDIS_URL", "memory://")
+
 # Create limiter instance
-limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=["100/minute"],
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="moving-window",
+    key_prefix="rl:",
+    in_memory_fallback_enabled=True  # Keep limiting per-process if Redis becomes unreachable
+)
 
 # Rate limit configurations
 RATE_LIMITS = {
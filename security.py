@@ -1,34 +1,46 @@
 """
 Authentication and security utilities for ArchCost API
 """
+import os
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import HTTPException, Request, status
 
 # Security configuration
 SECRET_KEY = "your-secret-key-change-in-production"  # CHANGE THIS IN PRODUCTION!
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-# Password hashing
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
-security = HTTPBearer()
+# passlib and PyJWT are imported on first use: only the admin endpoints need them,
+# so workers serving public traffic never load them
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """Password hashing context, built on first use"""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 # Admin credentials (in production, use database)
 ADMIN_USERNAME = "admin"
-try:
-    ADMIN_PASSWORD_HASH = pwd_context.hash("changeme123")
-except Exception as e:
-    # Fallback if hashing fails (shouldn't happen with pbkdf2)
-    print(f"Warning: Password hashing failed: {e}")
-    ADMIN_PASSWORD_HASH = "disabled"
+
+@lru_cache(maxsize=1)
+def get_admin_password_hash() -> str:
+    """Admin password hash, derived on first login instead of at import so startup runs no KDF.
+    Set ADMIN_PASSWORD_HASH to a precomputed pbkdf2_sha256 hash to skip hashing entirely."""
+    precomputed = os.getenv("ADMIN_PASSWORD_HASH")
+    if precomputed:
+        return precomputed
+    try:
+        return get_pwd_context().hash(os.getenv("ADMIN_PASSWORD", "changeme123"))
+    except Exception as e:
+        # Fallback if hashing fails (shouldn't happen with pbkdf2)
+        print(f"Warning: Password hashing failed: {e}")
+        return "disabled"
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
@@ -39,30 +51,44 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
+    import jwt
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+@lru_cache(maxsize=1024)
+def _decode_token(token: str) -> dict:
+    """Signature-checked claims for a token; memoized, so callers must re-check exp on every use"""
+    import jwt
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+def verify_admin_token(request: Request) -> dict:
     """Verify admin JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    # Read "Authorization: Bearer <token>" directly instead of via HTTPBearer's credentials object
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise credentials_exception
+    import jwt
     
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token.strip())
+        # A cached decode doesn't re-validate expiry, so enforce it here on every request
+        if payload.get("exp", 0) <= time.time():
+            raise credentials_exception
         username: str = payload.get("sub")
         if username is None or username != ADMIN_USERNAME:
             raise credentials_exception
-        return payload
-    except JWTError:
+        return dict(payload)
+    except jwt.PyJWTError:
         raise credentials_exception
 
 def authenticate_admin(username: str, password: str) -> Optional[str]:
     """Authenticate admin and return JWT token"""
-    if username == ADMIN_USERNAME and verify_password(password, ADMIN_PASSWORD_HASH):
+    if username == ADMIN_USERNAME and verify_password(password, get_admin_password_hash()):
         access_token = create_access_token(data={"sub": username})
         return access_token
     return None
@@ -1,3 +1,4 @@
+import orjson
 from fastapi.testclient import TestClient
 from main import app
 
@@ -42,14 +43,19 @@ B={
  }
 }
 
+# Serialize the payloads once up front; every POST reuses the same bytes
+A_BODY = orjson.dumps(A)
+B_BODY = orjson.dumps(B)
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
 # First request A
-r1 = client.post('/estimate', json=A)
+r1 = client.post('/estimate', content=A_BODY, headers=JSON_HEADERS)
 print('R1 status', r1.status_code)
 print('R1 ETag:', r1.headers.get('etag'))
 print('R1 total:', r1.json().get('monthly_cost',{}).get('total'))
 
 # Second request B
-r2 = client.post('/estimate', json=B)
+r2 = client.post('/estimate', content=B_BODY, headers=JSON_HEADERS)
 print('\nR2 status', r2.status_code)
 print('R2 ETag:', r2.headers.get('etag'))
 print('R2 total:', r2.json().get('monthly_cost',{}).get('total'))
@@ -57,7 +63,7 @@ print('R2 total:', r2.json().get('monthly_cost',{}).get('total'))
 # Re-send A with If-None-Match header
 etag = r1.headers.get('etag')
 if etag:
-    r3 = client.post('/estimate', json=A, headers={'If-None-Match': etag})
+    r3 = client.post('/estimate', content=A_BODY, headers={**JSON_HEADERS, 'If-None-Match': etag})
     print('\nR3 status (with If-None-Match):', r3.status_code)
     print('R3 headers:', {k:v for k,v in r3.headers.items() if k.lower() in ['etag','cache-control']})
     if r3.status_code == 304: